@@ -4,11 +4,14 @@ Web-style UI with sidebar navigation and tabbed content
 """
 
 import customtkinter as ctk
+import codecs
+import io
 import subprocess
 import threading
-import queue
 import os
 import re
+import time
+from collections import deque
 from datetime import datetime
 
 # Configure appearance
@@ -33,6 +36,87 @@ COLORS = {
     "border": "#2a2a2a",
 }
 
+# Colors used by the widget-heavy builders, bound once as module constants
+BG_PRIMARY = COLORS["bg_primary"]
+BG_SECONDARY = COLORS["bg_secondary"]
+BG_TERTIARY = COLORS["bg_tertiary"]
+BG_HOVER = COLORS["bg_hover"]
+TEXT_PRIMARY = COLORS["text_primary"]
+TEXT_SECONDARY = COLORS["text_secondary"]
+TEXT_MUTED = COLORS["text_muted"]
+ACCENT_GREEN = COLORS["accent_green"]
+ACCENT_RED = COLORS["accent_red"]
+BORDER = COLORS["border"]
+
+# Console icon for each activity type
+ACTIVITY_ICONS = {"join": "🟢", "leave": "🔴", "info": "ℹ️", "warn": "⚠️"}
+
+# Player join/leave lines from the server log, dispatched by group name
+PLAYER_EVENT_RE = re.compile(r"(?P<join>\w+) joined the game|(?P<leave>\w+) left the game")
+
+# Startup finished line, e.g. 'Done (3.2s)! For help, type "help"'
+SERVER_DONE_RE = re.compile(r"Done.*For help")
+
+# Tunnel address in playit output, e.g. "name.playit.gg:12345"
+PLAYIT_ADDRESS_RE = re.compile(r"([a-zA-Z0-9.-]+\.playit\.gg(?::\d+)?)")
+
+# "key=value" lines in .properties files, skipping comments
+PROPERTY_LINE_RE = re.compile(r"^[ \t]*([^=#\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$")
+
+# "key: value" YAML lines with a non-empty value, skipping comments
+YAML_SETTING_RE = re.compile(r"^(?![ \t]*#)[ \t]*([^:\n]*?)[ \t]*:[ \t]*(\S[^\n]*?)[ \t]*$")
+
+# Config files with more settings than this open in the raw text editor
+MAX_PROPERTY_ROWS = 100
+
+# Shared CTkFont instances, created on first use once the Tk root exists
+FONTS = {}
+
+
+def get_font(size, weight="normal", family=None):
+    """Return a shared CTkFont for the given size, weight and family"""
+    key = (size, weight, family)
+    if key not in FONTS:
+        if family:
+            FONTS[key] = ctk.CTkFont(family=family, size=size, weight=weight)
+        else:
+            FONTS[key] = ctk.CTkFont(size=size, weight=weight)
+    return FONTS[key]
+
+
+def read_pipe_lines(pipe, block_size=65536):
+    """Yield lists of complete lines from a pipe, one list per block read"""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    fd = pipe.fileno()
+    partial = ""
+    while True:
+        # Returns as soon as any output is available, up to block_size bytes
+        block = os.read(fd, block_size)
+        if not block:
+            break
+        lines = (partial + decoder.decode(block)).split("\n")
+        # The last piece has no newline yet; finish it with the next block
+        partial = lines.pop()
+        if lines:
+            yield lines
+    
+    partial += decoder.decode(b"", final=True)
+    if partial:
+        yield [partial]
+
+
+def write_file_atomic(path, lines, newline=''):
+    """Write lines to a temp file that replaces path only once complete"""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline=newline) as f:
+            f.writelines(lines)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 
 class MinecraftServerManager(ctk.CTk):
     def __init__(self):
@@ -50,27 +134,49 @@ class MinecraftServerManager(ctk.CTk):
         
         # Server state
         self.server_process = None
+        self._stdin = None
         self.server_status = "offline"
-        self.output_queue = queue.Queue()
+        # Lines from reader threads, handed to the UI thread in batches
+        self._out_deque = deque()
+        self._out_lock = threading.Lock()
+        self._drain_pending = False
         self.player_count = 0
         self.max_players = 20
-        self.online_players = []
-        self.recent_activity = []
+        self.online_players = {}  # name -> {"joined": monotonic time}
+        self._players_refresh_pending = False
+        self.recent_activity = deque(maxlen=10)
         
         # Playit.gg state
         self.playit_process = None
         self.playit_running = False
+        self._playit_address_found = False
         self.playit_exe = os.path.join(self.server_dir, "playit.exe")
         
         # Backup state
         self.backup_interval = 600000  # 10 minutes in ms
         self.last_backup = None
+        self._last_backup_text = "Last backup: Never"
+        self._backup_log_backlog = []
+        # Held while a backup runs so manual and auto backups queue instead of overlapping
+        self._backup_lock = threading.Lock()
+        self._remote_branch = None
+        self._remote_tip = None
+        
+        # Parsed config cache: path -> (mtime_ns, properties)
+        self._config_cache = {}
+        
+        # Formatted timestamp cache: format -> (second, text)
+        self._timestamp_cache = {}
+        
+        # Last options applied through set_widget: widget -> {option: value}
+        self._widget_state = {}
         
         # Build UI
         self.create_ui()
         
-        # Start output reader
-        self.after(100, self.process_output_queue)
+        # Initial backup log messages
+        self.log_backup("Backup system initialized")
+        self.log_backup(f"Auto-backup every 10 minutes while server runs")
         
         # Start backup timer
         self.after(self.backup_interval, self.auto_backup)
@@ -103,18 +209,24 @@ class MinecraftServerManager(ctk.CTk):
         self.content_container.grid_columnconfigure(0, weight=1)
         self.content_container.grid_rowconfigure(0, weight=1)
         
-        # Create all tabs
-        self.create_console_tab()
-        self.create_players_tab()
-        self.create_settings_tab()
-        self.create_backup_tab()
+        # Tabs are built the first time they are shown
+        self._tab_builders = {
+            "console": self.create_console_tab,
+            "players": self.create_players_tab,
+            "settings": self.create_settings_tab,
+            "backup": self.create_backup_tab,
+        }
+        self._built_tabs = set()
         
         # Show console tab by default
         self.show_tab("console")
+        
+        # Reader threads wake the UI thread through this virtual event
+        self.bind("<<ServerOutput>>", lambda e: self.process_output_queue())
     
     def create_sidebar(self):
         """Create the sidebar with navigation"""
-        self.sidebar = ctk.CTkFrame(self, width=200, corner_radius=0, fg_color=COLORS["bg_secondary"])
+        self.sidebar = ctk.CTkFrame(self, width=200, corner_radius=0, fg_color=BG_SECONDARY)
         self.sidebar.grid(row=0, column=0, sticky="nsew")
         self.sidebar.grid_rowconfigure(2, weight=1)
         self.sidebar.grid_propagate(False)
@@ -126,20 +238,20 @@ class MinecraftServerManager(ctk.CTk):
         self.logo_icon = ctk.CTkLabel(
             self.logo_frame,
             text="⛏️",
-            font=ctk.CTkFont(size=24)
+            font=get_font(24)
         )
         self.logo_icon.grid(row=0, column=0, padx=(0, 8))
         
         self.logo_text = ctk.CTkLabel(
             self.logo_frame,
             text="MC Server",
-            font=ctk.CTkFont(size=15, weight="bold"),
-            text_color=COLORS["accent_green"]
+            font=get_font(15, "bold"),
+            text_color=ACCENT_GREEN
         )
         self.logo_text.grid(row=0, column=1)
         
         # Separator
-        sep1 = ctk.CTkFrame(self.sidebar, height=1, fg_color=COLORS["border"])
+        sep1 = ctk.CTkFrame(self.sidebar, height=1, fg_color=BORDER)
         sep1.grid(row=1, column=0, sticky="ew", padx=0)
         
         # Navigation - compact buttons
@@ -158,12 +270,12 @@ class MinecraftServerManager(ctk.CTk):
             btn = ctk.CTkButton(
                 self.nav_frame,
                 text=f"{icon}  {text}",
-                font=ctk.CTkFont(size=13),
+                font=get_font(13),
                 height=36,
                 anchor="w",
                 fg_color="transparent",
-                text_color=COLORS["text_secondary"],
-                hover_color=COLORS["bg_hover"],
+                text_color=TEXT_SECONDARY,
+                hover_color=BG_HOVER,
                 corner_radius=6,
                 command=lambda t=tab_id: self.show_tab(t)
             )
@@ -171,7 +283,7 @@ class MinecraftServerManager(ctk.CTk):
             self.nav_buttons[tab_id] = btn
         
         # Combined status section - compact
-        self.info_section = ctk.CTkFrame(self.sidebar, fg_color=COLORS["bg_tertiary"], corner_radius=8)
+        self.info_section = ctk.CTkFrame(self.sidebar, fg_color=BG_TERTIARY, corner_radius=8)
         self.info_section.grid(row=3, column=0, sticky="sew", padx=10, pady=10)
         
         # Server status row
@@ -181,23 +293,23 @@ class MinecraftServerManager(ctk.CTk):
         ctk.CTkLabel(
             server_row,
             text="Server",
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS["text_muted"]
+            font=get_font(11),
+            text_color=TEXT_MUTED
         ).pack(side="left")
         
         self.status_indicator = ctk.CTkLabel(
             server_row,
             text="●",
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["accent_red"]
+            font=get_font(12),
+            text_color=ACCENT_RED
         )
         self.status_indicator.pack(side="right", padx=(0, 4))
         
         self.status_label = ctk.CTkLabel(
             server_row,
             text="Offline",
-            font=ctk.CTkFont(size=11, weight="bold"),
-            text_color=COLORS["text_primary"]
+            font=get_font(11, "bold"),
+            text_color=TEXT_PRIMARY
         )
         self.status_label.pack(side="right")
         
@@ -208,23 +320,23 @@ class MinecraftServerManager(ctk.CTk):
         ctk.CTkLabel(
             playit_row,
             text="Tunnel",
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS["text_muted"]
+            font=get_font(11),
+            text_color=TEXT_MUTED
         ).pack(side="left")
         
         self.playit_indicator = ctk.CTkLabel(
             playit_row,
             text="●",
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["accent_red"]
+            font=get_font(12),
+            text_color=ACCENT_RED
         )
         self.playit_indicator.pack(side="right", padx=(0, 4))
         
         self.playit_status = ctk.CTkLabel(
             playit_row,
             text="Offline",
-            font=ctk.CTkFont(size=11, weight="bold"),
-            text_color=COLORS["text_primary"]
+            font=get_font(11, "bold"),
+            text_color=TEXT_PRIMARY
         )
         self.playit_status.pack(side="right")
         
@@ -232,8 +344,8 @@ class MinecraftServerManager(ctk.CTk):
         self.playit_address_label = ctk.CTkLabel(
             self.info_section,
             text="",
-            font=ctk.CTkFont(size=9),
-            text_color=COLORS["accent_green"],
+            font=get_font(9),
+            text_color=ACCENT_GREEN,
             wraplength=160
         )
         self.playit_address_label.pack(fill="x", padx=12, pady=(0, 10))
@@ -251,7 +363,7 @@ class MinecraftServerManager(ctk.CTk):
         self.header_title = ctk.CTkLabel(
             self.header,
             text="Minecraft Server",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=get_font(20, "bold"),
             text_color=COLORS["text_primary"]
         )
         self.header_title.grid(row=0, column=0, padx=24, pady=16, sticky="w")
@@ -264,7 +376,7 @@ class MinecraftServerManager(ctk.CTk):
         self.start_btn = ctk.CTkButton(
             self.controls_frame,
             text="▶ Start",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(13, "bold"),
             width=85,
             height=32,
             fg_color=COLORS["accent_green"],
@@ -279,7 +391,7 @@ class MinecraftServerManager(ctk.CTk):
         self.restart_btn = ctk.CTkButton(
             self.controls_frame,
             text="🔄 Restart",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(13, "bold"),
             width=95,
             height=32,
             fg_color=COLORS["accent_yellow"],
@@ -295,7 +407,7 @@ class MinecraftServerManager(ctk.CTk):
         self.stop_btn = ctk.CTkButton(
             self.controls_frame,
             text="⏹ Stop",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(13, "bold"),
             width=85,
             height=32,
             fg_color=COLORS["accent_red"],
@@ -327,7 +439,7 @@ class MinecraftServerManager(ctk.CTk):
         ctk.CTkLabel(
             self.console_header,
             text="Server Console",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color=COLORS["text_primary"]
         ).grid(row=0, column=0, padx=16, pady=12, sticky="w")
         
@@ -336,7 +448,7 @@ class MinecraftServerManager(ctk.CTk):
             text="Clear",
             width=60,
             height=28,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             fg_color=COLORS["bg_hover"],
             hover_color=COLORS["bg_tertiary"],
             text_color=COLORS["text_secondary"],
@@ -348,13 +460,14 @@ class MinecraftServerManager(ctk.CTk):
         # Console output
         self.console = ctk.CTkTextbox(
             self.console_container,
-            font=ctk.CTkFont(family="Consolas", size=13),
+            font=get_font(13, family="Consolas"),
             fg_color=COLORS["bg_primary"],
             text_color="#e0e0e0",
             corner_radius=0
         )
         self.console.grid(row=1, column=0, sticky="nsew", padx=0, pady=0)
         self.console.configure(state="disabled")
+        self._console_lines = 0
         
         # Console input area
         self.console_input_frame = ctk.CTkFrame(self.console_container, fg_color=COLORS["bg_tertiary"], corner_radius=0)
@@ -364,14 +477,14 @@ class MinecraftServerManager(ctk.CTk):
         self.prompt_label = ctk.CTkLabel(
             self.console_input_frame,
             text=">",
-            font=ctk.CTkFont(family="Consolas", size=14, weight="bold"),
+            font=get_font(14, "bold", family="Consolas"),
             text_color=COLORS["accent_green"]
         )
         self.prompt_label.grid(row=0, column=0, padx=(16, 8), pady=12)
         
         self.command_input = ctk.CTkEntry(
             self.console_input_frame,
-            font=ctk.CTkFont(family="Consolas", size=13),
+            font=get_font(13, family="Consolas"),
             placeholder_text="Enter command...",
             fg_color=COLORS["bg_primary"],
             border_color=COLORS["border"],
@@ -387,7 +500,7 @@ class MinecraftServerManager(ctk.CTk):
             text="Send",
             width=80,
             height=38,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             fg_color=COLORS["accent_blue"],
             hover_color="#2563eb",
             corner_radius=8,
@@ -414,14 +527,14 @@ class MinecraftServerManager(ctk.CTk):
         ctk.CTkLabel(
             self.players_card,
             text="Online Players",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=get_font(18, "bold"),
             text_color=COLORS["text_primary"]
         ).grid(row=0, column=0, padx=24, pady=(24, 8), sticky="w")
         
         self.player_count_label = ctk.CTkLabel(
             self.players_card,
             text="Player list will appear when server is running.",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             text_color=COLORS["text_muted"]
         )
         self.player_count_label.grid(row=0, column=0, padx=24, pady=(24, 8), sticky="e")
@@ -436,10 +549,19 @@ class MinecraftServerManager(ctk.CTk):
         self.no_players_label = ctk.CTkLabel(
             self.players_list,
             text="No players online",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             text_color=COLORS["text_muted"]
         )
         self.no_players_label.pack(pady=20)
+        self._no_players_shown = True
+        self._player_rows = {}
+        self._player_row_pool = []
+        
+        # Catch up with players who joined before the tab was opened
+        if self.server_status != "offline":
+            self.update_player_count_label()
+        if self.online_players:
+            self.update_player_list()
     
     def create_settings_tab(self):
         """Create the Settings tab content with editable config files"""
@@ -461,7 +583,7 @@ class MinecraftServerManager(ctk.CTk):
         ctk.CTkLabel(
             header_frame,
             text="Config File:",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             text_color=COLORS["text_secondary"]
         ).grid(row=0, column=0, padx=(0, 10), sticky="w")
         
@@ -486,7 +608,7 @@ class MinecraftServerManager(ctk.CTk):
         self.file_selector = ctk.CTkOptionMenu(
             header_frame,
             values=list(self.config_files.keys()),
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=200,
             height=32,
             fg_color=COLORS["bg_tertiary"],
@@ -497,11 +619,23 @@ class MinecraftServerManager(ctk.CTk):
         )
         self.file_selector.grid(row=0, column=1, sticky="w")
         
-        # Search entry
+        # Search entry, searched whenever its text changes. It can't show a
+        # placeholder while bound to a textvariable, so an icon labels it
+        search_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
+        search_frame.grid(row=0, column=2, padx=(10, 0), sticky="w")
+        
+        ctk.CTkLabel(
+            search_frame,
+            text="🔍",
+            font=get_font(14),
+            text_color=COLORS["text_secondary"]
+        ).pack(side="left", padx=(0, 4))
+        
+        self.search_var = ctk.StringVar()
         self.search_entry = ctk.CTkEntry(
-            header_frame,
-            placeholder_text="🔍 Search...",
-            font=ctk.CTkFont(size=12),
+            search_frame,
+            textvariable=self.search_var,
+            font=get_font(12),
             width=120,
             height=32,
             fg_color=COLORS["bg_tertiary"],
@@ -509,14 +643,16 @@ class MinecraftServerManager(ctk.CTk):
             text_color=COLORS["text_primary"],
             corner_radius=6
         )
-        self.search_entry.grid(row=0, column=2, padx=(10, 0), sticky="w")
-        self.search_entry.bind("<Return>", lambda e: self.search_property())
-        self.search_entry.bind("<KeyRelease>", lambda e: self.search_property())
+        self.search_entry.pack(side="left")
+        self.search_var.trace_add("write", lambda *args: self.schedule_search())
+        self._search_after_id = None
+        self._search_keys_lower = []
+        self._prev_matches = set()
         
         self.save_config_btn = ctk.CTkButton(
             header_frame,
             text="💾 Save",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(13, "bold"),
             width=80,
             height=32,
             fg_color=COLORS["accent_green"],
@@ -530,7 +666,7 @@ class MinecraftServerManager(ctk.CTk):
         self.file_path_label = ctk.CTkLabel(
             self.settings_card,
             text="",
-            font=ctk.CTkFont(family="Consolas", size=10),
+            font=get_font(10, family="Consolas"),
             text_color=COLORS["text_muted"]
         )
         self.file_path_label.grid(row=1, column=0, padx=20, pady=(0, 8), sticky="w")
@@ -546,6 +682,8 @@ class MinecraftServerManager(ctk.CTk):
         
         # Store entry widgets and current file type
         self.config_entries = {}
+        self._entry_pool = []
+        self.text_editor = None
         self.current_file_path = ""
         self.current_file_type = "properties"
         
@@ -572,14 +710,14 @@ class MinecraftServerManager(ctk.CTk):
         ctk.CTkLabel(
             header,
             text="Backup Logs",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=get_font(18, "bold"),
             text_color=COLORS["text_primary"]
         ).grid(row=0, column=0, sticky="w")
         
         self.manual_backup_btn = ctk.CTkButton(
             header,
             text="📤 Backup Now",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(13, "bold"),
             width=120,
             height=32,
             fg_color=COLORS["accent_blue"],
@@ -592,8 +730,8 @@ class MinecraftServerManager(ctk.CTk):
         # Last backup info
         self.last_backup_label = ctk.CTkLabel(
             backup_card,
-            text="Last backup: Never",
-            font=ctk.CTkFont(size=12),
+            text=self._last_backup_text,
+            font=get_font(12),
             text_color=COLORS["text_muted"]
         )
         self.last_backup_label.grid(row=1, column=0, padx=20, pady=(0, 4), sticky="w")
@@ -601,29 +739,49 @@ class MinecraftServerManager(ctk.CTk):
         # Backup log textbox
         self.backup_log = ctk.CTkTextbox(
             backup_card,
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=get_font(12, family="Consolas"),
             fg_color=COLORS["bg_primary"],
             text_color=COLORS["text_primary"],
             state="disabled"
         )
         self.backup_log.grid(row=2, column=0, sticky="nsew", padx=16, pady=(8, 16))
         
-        # Initial message
-        self.log_backup("Backup system initialized")
-        self.log_backup(f"Auto-backup every 10 minutes while server runs")
+        # Show messages logged before the tab was opened
+        self.write_backup_log("".join(self._backup_log_backlog))
+        self._backup_log_backlog.clear()
+    
+    def timestamp(self, fmt):
+        """Format the current time, reusing the result within the same second"""
+        now = int(time.time())
+        cached = self._timestamp_cache.get(fmt)
+        if cached and cached[0] == now:
+            return cached[1]
+        text = time.strftime(fmt, time.localtime(now))
+        self._timestamp_cache[fmt] = (now, text)
+        return text
     
     def log_backup(self, message):
         """Add a message to the backup log"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self.timestamp("%Y-%m-%d %H:%M:%S")
+        line = f"[{timestamp}] {message}\n"
+        if "backup" not in self._built_tabs:
+            self._backup_log_backlog.append(line)
+            return
+        self.write_backup_log(line)
+    
+    def write_backup_log(self, text):
+        """Append raw text to the backup log textbox"""
         self.backup_log.configure(state="normal")
-        self.backup_log.insert("end", f"[{timestamp}] {message}\n")
+        self.backup_log.insert("end", text)
         self.backup_log.see("end")
         self.backup_log.configure(state="disabled")
     
     def update_last_backup_label(self):
         """Update the last backup label with current time"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.last_backup_label.configure(text=f"Last backup: {timestamp}")
+        timestamp = self.timestamp("%Y-%m-%d %H:%M:%S")
+        self._last_backup_text = f"Last backup: {timestamp}"
+        if "backup" in self._built_tabs:
+            self.last_backup_label.configure(text=self._last_backup_text)
     
     def on_config_selected(self, selection):
         """Handle config file selection"""
@@ -638,20 +796,29 @@ class MinecraftServerManager(ctk.CTk):
         # Update path label
         self.file_path_label.configure(text=f"📁 {relative_path}")
         
-        # Clear existing widgets
+        # Clear existing widgets, keeping pooled entry rows for reuse
+        pooled = {frame for frame, _, _ in self._entry_pool}
         for widget in self.config_scroll.winfo_children():
-            widget.destroy()
+            if widget not in pooled:
+                widget.destroy()
+        self.hide_pooled_entries()
         self.config_entries.clear()
+        self._search_keys_lower = []
+        self._prev_matches = set()
+        self.text_editor = None
         
         if not os.path.exists(self.current_file_path):
             ctk.CTkLabel(
                 self.config_scroll,
                 text=f"File not found: {relative_path}",
-                font=ctk.CTkFont(size=14),
+                font=get_font(14),
                 text_color=COLORS["accent_red"]
-            ).pack(pady=20)
+            ).grid(row=0, column=0, columnspan=2, pady=20)
             return
         
+        # Parsed results are cached until the file changes on disk
+        self.current_file_mtime = os.stat(self.current_file_path).st_mtime_ns
+        
         # Determine file type
         if self.current_file_path.endswith('.properties'):
             self.current_file_type = "properties"
@@ -663,43 +830,72 @@ class MinecraftServerManager(ctk.CTk):
             self.current_file_type = "text"
             self.load_text_file()
     
+    def get_cached_config(self):
+        """Return the cached parse of the current file if it is unchanged on disk"""
+        cached = self._config_cache.get(self.current_file_path)
+        if cached and cached[0] == self.current_file_mtime:
+            return cached[1]
+        return None
+    
+    def cache_config(self, parsed):
+        """Remember the parse of the current file"""
+        self._config_cache[self.current_file_path] = (self.current_file_mtime, parsed)
+    
+    def parse_config(self):
+        """Read the current file and index each setting by its line number"""
+        pattern = PROPERTY_LINE_RE if self.current_file_type == "properties" else YAML_SETTING_RE
+        # Keep each line's own ending (\n or \r\n) so saves write it back unchanged
+        with open(self.current_file_path, 'r', encoding='utf-8', newline='') as f:
+            lines = f.readlines()
+        
+        properties = []
+        line_index = {}
+        for i, line in enumerate(lines):
+            match = pattern.match(line.rstrip('\r\n'))
+            if match:
+                key, value = match.groups()
+                properties.append((key, value))
+                line_index[key] = i
+        return properties, lines, line_index
+    
+    def use_parsed_config(self, parsed):
+        """Make a parse the model that save_config patches"""
+        properties, lines, self._line_index = parsed
+        self._file_lines = list(lines)
+        self._saved_values = dict(properties)
+        # Row list as loaded, duplicates included; a repeated key maps to its last row like _line_index
+        self._properties = list(properties)
+        self._property_pos = {key: i for i, (key, _) in enumerate(properties)}
+        return properties
+    
+    def load_config_model(self):
+        """Parse the current file, reusing the cache when it is unchanged"""
+        parsed = self.get_cached_config()
+        if parsed is None:
+            try:
+                parsed = self.parse_config()
+            except Exception as e:
+                self.log_message(f"[Settings] Error: {e}", "error")
+                return None
+            self.cache_config(parsed)
+        return self.use_parsed_config(parsed)
+    
     def load_properties_file(self):
         """Load .properties file"""
-        properties = []
-        try:
-            with open(self.current_file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        properties.append((key.strip(), value.strip()))
-        except Exception as e:
-            self.log_message(f"[Settings] Error: {e}", "error")
+        properties = self.load_config_model()
+        if properties is None:
             return
         
-        self.create_property_entries(properties)
+        self.show_properties(properties)
         self.log_message(f"[Settings] Loaded {len(properties)} properties", "info")
     
     def load_yaml_file(self):
         """Load YAML file as key-value pairs"""
-        properties = []
-        try:
-            with open(self.current_file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    stripped = line.strip()
-                    if stripped and not stripped.startswith('#') and ':' in stripped:
-                        # Simple YAML parsing (key: value format)
-                        parts = stripped.split(':', 1)
-                        key = parts[0].strip()
-                        value = parts[1].strip() if len(parts) > 1 else ""
-                        # Skip section headers (no value)
-                        if value or not stripped.endswith(':'):
-                            properties.append((key, value))
-        except Exception as e:
-            self.log_message(f"[Settings] Error: {e}", "error")
+        properties = self.load_config_model()
+        if properties is None:
             return
         
-        self.create_property_entries(properties)
+        self.show_properties(properties)
         self.log_message(f"[Settings] Loaded {len(properties)} settings", "info")
     
     def load_text_file(self):
@@ -707,49 +903,94 @@ class MinecraftServerManager(ctk.CTk):
         try:
             with open(self.current_file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
+                # Write the file back with the line ending it was read with
+                self._text_newline = f.newlines if isinstance(f.newlines, str) else "\n"
             
             self.text_editor = ctk.CTkTextbox(
                 self.config_scroll,
-                font=ctk.CTkFont(family="Consolas", size=12),
+                font=get_font(12, family="Consolas"),
                 fg_color=COLORS["bg_primary"],
-                text_color=COLORS["text_primary"]
+                text_color=COLORS["text_primary"],
+                height=520
             )
-            self.text_editor.pack(fill="both", expand=True, pady=8)
+            self.text_editor.grid(row=0, column=0, columnspan=2, sticky="nsew", pady=8)
             self.text_editor.insert("1.0", content)
+            self.text_editor.tag_config("search_hit", background=COLORS["accent_green"], foreground="#000000")
+            self.text_editor.bind("<Control-f>", self.focus_search)
         except Exception as e:
             self.log_message(f"[Settings] Error: {e}", "error")
     
+    def show_properties(self, properties):
+        """Show properties as entry rows, or as raw text for large files"""
+        if len(properties) > MAX_PROPERTY_ROWS:
+            self.current_file_type = "text"
+            self.load_text_file()
+        else:
+            self.create_property_entries(properties)
+    
+    def focus_search(self, event=None):
+        """Move focus to the settings search box"""
+        self.search_entry.focus_set()
+        return "break"
+    
     def create_property_entries(self, properties):
-        """Create entry widgets for properties"""
+        """Fill entry widgets for properties, reusing pooled rows"""
         for i, (key, value) in enumerate(properties):
             row = i // 2
             col = i % 2
             
-            prop_frame = ctk.CTkFrame(self.config_scroll, fg_color=COLORS["bg_tertiary"], corner_radius=6)
-            prop_frame.grid(row=row, column=col, sticky="ew", padx=4, pady=3)
-            prop_frame.grid_columnconfigure(1, weight=1)
-            
-            ctk.CTkLabel(
-                prop_frame,
-                text=key,
-                font=ctk.CTkFont(family="Consolas", size=10),
-                text_color=COLORS["text_secondary"],
-                wraplength=100
-            ).grid(row=0, column=0, padx=(8, 4), pady=6, sticky="w")
+            if i < len(self._entry_pool):
+                prop_frame, label, entry = self._entry_pool[i]
+                label.configure(text=key)
+                entry.configure(border_color=BORDER)
+                entry.delete(0, "end")
+            else:
+                prop_frame, label, entry = self.create_entry_row()
+                self._entry_pool.append((prop_frame, label, entry))
             
-            entry = ctk.CTkEntry(
-                prop_frame,
-                font=ctk.CTkFont(family="Consolas", size=10),
-                fg_color=COLORS["bg_primary"],
-                border_color=COLORS["border"],
-                text_color=COLORS["accent_green"],
-                height=26,
-                corner_radius=4
-            )
             entry.insert(0, value)
-            entry.grid(row=0, column=1, padx=(0, 8), pady=6, sticky="ew")
+            prop_frame.grid(row=row, column=col, sticky="ew", padx=4, pady=3)
             
             self.config_entries[key] = entry
+        
+        # Hide rows left over from a larger file
+        self.hide_pooled_entries(len(properties))
+        
+        # Lowercase keys once so searching doesn't redo it per keystroke
+        self._search_keys_lower = [(key, key.lower()) for key in self.config_entries]
+        self._prev_matches = set()
+    
+    def create_entry_row(self):
+        """Create one frame/label/entry row for the settings grid"""
+        prop_frame = ctk.CTkFrame(self.config_scroll, fg_color=BG_TERTIARY, corner_radius=6)
+        prop_frame.grid_columnconfigure(1, weight=1)
+        
+        label = ctk.CTkLabel(
+            prop_frame,
+            text="",
+            font=get_font(10, family="Consolas"),
+            text_color=TEXT_SECONDARY,
+            wraplength=100
+        )
+        label.grid(row=0, column=0, padx=(8, 4), pady=6, sticky="w")
+        
+        entry = ctk.CTkEntry(
+            prop_frame,
+            font=get_font(10, family="Consolas"),
+            fg_color=BG_PRIMARY,
+            border_color=BORDER,
+            text_color=ACCENT_GREEN,
+            height=26,
+            corner_radius=4
+        )
+        entry.grid(row=0, column=1, padx=(0, 8), pady=6, sticky="ew")
+        
+        return prop_frame, label, entry
+    
+    def hide_pooled_entries(self, start=0):
+        """Hide pooled entry rows from index start onwards"""
+        for prop_frame, _, _ in self._entry_pool[start:]:
+            prop_frame.grid_remove()
     
     def save_config(self):
         """Save current config file"""
@@ -761,33 +1002,45 @@ class MinecraftServerManager(ctk.CTk):
             if self.current_file_type == "text":
                 # Save text file
                 content = self.text_editor.get("1.0", "end-1c")
-                with open(self.current_file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                write_file_atomic(self.current_file_path, [content], newline=self._text_newline)
             else:
-                # Save properties/yaml file
-                lines = []
-                with open(self.current_file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
+                # Save properties/yaml file by patching only the lines of settings edited here
+                edited = {}
+                for key, entry in self.config_entries.items():
+                    new_value = entry.get()
+                    if new_value != self._saved_values.get(key):
+                        edited[key] = new_value
                 
-                separator = '=' if self.current_file_type == "properties" else ':'
-                new_lines = []
+                if os.stat(self.current_file_path).st_mtime_ns != self.current_file_mtime:
+                    # Edited on disk since loading, so patch a fresh copy and keep those edits
+                    self.use_parsed_config(self.parse_config())
+                    # Show the outside values too, or the next save would count them as edits
+                    for key, entry in self.config_entries.items():
+                        if key not in edited and key in self._saved_values:
+                            entry.delete(0, "end")
+                            entry.insert(0, self._saved_values[key])
                 
-                for line in lines:
-                    stripped = line.strip()
-                    if stripped and not stripped.startswith('#') and separator in stripped:
-                        key = stripped.split(separator, 1)[0].strip()
-                        if key in self.config_entries:
-                            new_value = self.config_entries[key].get()
-                            # Preserve indentation
-                            indent = len(line) - len(line.lstrip())
-                            new_lines.append(f"{' ' * indent}{key}{separator} {new_value}\n" if separator == ':' else f"{key}={new_value}\n")
-                        else:
-                            new_lines.append(line)
+                separator = '=' if self.current_file_type == "properties" else ':'
+                for key, new_value in edited.items():
+                    if key not in self._line_index:
+                        continue
+                    idx = self._line_index[key]
+                    line = self._file_lines[idx]
+                    ending = line[len(line.rstrip('\r\n')):]
+                    if separator == ':':
+                        # Preserve indentation
+                        indent = line[:len(line) - len(line.lstrip())]
+                        self._file_lines[idx] = f"{indent}{key}{separator} {new_value}{ending}"
                     else:
-                        new_lines.append(line)
+                        self._file_lines[idx] = f"{key}={new_value}{ending}"
+                    self._saved_values[key] = new_value
+                    self._properties[self._property_pos[key]] = (key, new_value)
+                
+                write_file_atomic(self.current_file_path, self._file_lines)
+                self.current_file_mtime = os.stat(self.current_file_path).st_mtime_ns
                 
-                with open(self.current_file_path, 'w', encoding='utf-8') as f:
-                    f.writelines(new_lines)
+                # The in-memory model now matches the file, so reloading needn't re-read it
+                self.cache_config((list(self._properties), list(self._file_lines), self._line_index))
             
             self.log_message(f"[Settings] Saved {self.current_config}!", "success")
             self.save_config_btn.configure(text="✓ Saved")
@@ -796,41 +1049,72 @@ class MinecraftServerManager(ctk.CTk):
         except Exception as e:
             self.log_message(f"[Settings] Error saving: {e}", "error")
     
+    def schedule_search(self):
+        """Run search_property once typing pauses"""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(80, self.search_property)
+    
     def search_property(self):
         """Search and highlight matching properties"""
-        query = self.search_entry.get().lower().strip()
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        
+        query = self.search_var.get().lower().strip()
         
-        if not query:
-            # Reset all entries to normal color
-            for entry in self.config_entries.values():
-                entry.configure(border_color=COLORS["border"])
+        if self.current_file_type == "text":
+            if self.text_editor:
+                self.search_text_editor(query)
             return
         
-        # Skip search if query too short
+        # Skip search if query too short; an empty query clears all highlights
+        if query and len(query) < 2:
+            return
+        
+        matches = {key for key, key_lower in self._search_keys_lower if query in key_lower} if query else set()
+        
+        # Only reconfigure entries whose highlight actually changes
+        for key in matches - self._prev_matches:
+            self.config_entries[key].configure(border_color=ACCENT_GREEN)
+        for key in self._prev_matches - matches:
+            self.config_entries[key].configure(border_color=BORDER)
+        self._prev_matches = matches
+    
+    def search_text_editor(self, query):
+        """Highlight every match of query in the raw text editor"""
+        self.text_editor.tag_remove("search_hit", "1.0", "end")
         if len(query) < 2:
             return
         
-        for key, entry in self.config_entries.items():
-            if query in key.lower():
-                entry.configure(border_color=COLORS["accent_green"])
-            else:
-                entry.configure(border_color=COLORS["border"])
+        first_hit = None
+        start = "1.0"
+        while True:
+            pos = self.text_editor.search(query, start, stopindex="end", nocase=True)
+            if not pos:
+                break
+            start = f"{pos}+{len(query)}c"
+            self.text_editor.tag_add("search_hit", pos, start)
+            first_hit = first_hit or pos
+        
+        if first_hit:
+            self.text_editor.see(first_hit)
     
     def clear_console(self):
         """Clear the console output"""
         self.console.configure(state="normal")
         self.console.delete("1.0", "end")
         self.console.configure(state="disabled")
+        self._console_lines = 0
     
     def show_tab(self, tab_name):
-        """Switch between tabs"""
-        # Store all tabs
-        tabs = {
-            "console": self.console_tab,
-            "players": self.players_tab,
-            "settings": self.settings_tab,
-            "backup": self.backup_tab
-        }
+        """Switch between tabs, building the tab on first use"""
+        if tab_name not in self._built_tabs:
+            self._built_tabs.add(tab_name)
+            self._tab_builders[tab_name]()
+        
+        # Store all built tabs
+        tabs = {name: getattr(self, f"{name}_tab") for name in self._built_tabs}
         
         # Hide all tabs
         for tab in tabs.values():
@@ -849,84 +1133,142 @@ class MinecraftServerManager(ctk.CTk):
     def add_activity(self, text, activity_type="info"):
         """Add an activity entry (now logs to console)"""
         # Icon based on type
-        icons = {"join": "🟢", "leave": "🔴", "info": "ℹ️", "warn": "⚠️"}
-        icon = icons.get(activity_type, "📌")
+        icon = ACTIVITY_ICONS.get(activity_type, "📌")
         
         # Log activity to console
         self.log_message(f"{icon} {text}", activity_type)
-        self.recent_activity.append(text)
         
-        # Keep activity list limited
-        if len(self.recent_activity) > 10:
-            self.recent_activity.pop(0)
+        # Bounded, so the oldest entry drops off automatically
+        self.recent_activity.append(text)
+    
+    def update_players(self, added=None, removed=None, clear=False):
+        """Apply a player change and schedule one refresh of the Players tab"""
+        if clear:
+            self.online_players.clear()
+        if added:
+            self.online_players[added] = {"joined": time.monotonic()}
+        if removed:
+            self.online_players.pop(removed, None)
+        
+        self.player_count = len(self.online_players)
+        self.mark_players_dirty()
+    
+    def update_player_count_label(self):
+        """Show the current player count on the Players tab"""
+        if "players" not in self._built_tabs:
+            return
+        text = f"{self.player_count}/{self.max_players} online"
+        if self.player_count_label.cget("text") != text:
+            self.player_count_label.configure(text=text)
+    
+    def mark_players_dirty(self):
+        """Refresh the Players tab once the current burst of changes is done"""
+        if not self._players_refresh_pending:
+            self._players_refresh_pending = True
+            self.after_idle(self.flush_player_list)
+    
+    def flush_player_list(self):
+        """Run the pending player count and list refresh"""
+        self._players_refresh_pending = False
+        self.update_player_count_label()
+        self.update_player_list()
     
     def update_player_list(self):
-        """Update the online players list"""
-        # Clear existing
-        for widget in self.players_list.winfo_children():
-            widget.destroy()
-        
-        if not self.online_players:
-            self.no_players_label = ctk.CTkLabel(
-                self.players_list,
-                text="No players online",
-                font=ctk.CTkFont(size=14),
-                text_color=COLORS["text_muted"]
-            )
-            self.no_players_label.pack(pady=20)
-        else:
-            for i, player in enumerate(self.online_players):
-                frame = ctk.CTkFrame(self.players_list, fg_color=COLORS["bg_tertiary"], corner_radius=8)
+        """Update the online players list, touching only rows that changed"""
+        if "players" not in self._built_tabs:
+            return
+        
+        # Hide rows for players who left and keep them for reuse
+        for player in [p for p in self._player_rows if p not in self.online_players]:
+            frame, label = self._player_rows.pop(player)
+            frame.pack_forget()
+            self._player_row_pool.append((frame, label))
+        
+        # Add rows for new players, in join order
+        for player in self.online_players:
+            if player not in self._player_rows:
+                if self._player_row_pool:
+                    frame, label = self._player_row_pool.pop()
+                else:
+                    frame, label = self.create_player_row()
+                label.configure(text=f"👤 {player}")
                 frame.pack(fill="x", pady=4)
-                
-                ctk.CTkLabel(
-                    frame,
-                    text=f"👤 {player}",
-                    font=ctk.CTkFont(size=14),
-                    text_color=COLORS["text_primary"]
-                ).pack(padx=16, pady=12, anchor="w")
+                self._player_rows[player] = (frame, label)
+        
+        # Only show the placeholder while nobody is online
+        if self.online_players and self._no_players_shown:
+            self.no_players_label.pack_forget()
+            self._no_players_shown = False
+        elif not self.online_players and not self._no_players_shown:
+            self.no_players_label.pack(pady=20)
+            self._no_players_shown = True
+    
+    def create_player_row(self):
+        """Create one frame/label row for the players list"""
+        frame = ctk.CTkFrame(self.players_list, fg_color=BG_TERTIARY, corner_radius=8)
+        
+        label = ctk.CTkLabel(
+            frame,
+            text="",
+            font=get_font(14),
+            text_color=TEXT_PRIMARY
+        )
+        label.pack(padx=16, pady=12, anchor="w")
+        return frame, label
     
     def log_message(self, message, level="normal"):
         """Add a message to the console"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.write_console([message])
+    
+    def write_console(self, messages):
+        """Append a batch of messages to the console with a single insert"""
+        timestamp = self.timestamp("%H:%M:%S")
+        text = "".join(f"[{timestamp}] {message}\n" for message in messages)
         
         self.console.configure(state="normal")
-        self.console.insert("end", f"[{timestamp}] {message}\n")
+        self.console.insert("end", text)
         
-        # Limit console to last 500 lines for performance
-        line_count = int(self.console.index('end-1c').split('.')[0])
-        if line_count > 500:
-            self.console.delete("1.0", "100.0")
+        # Limit console to last 500 lines for performance, counted here
+        # rather than asking Tk for the end index (messages may span lines)
+        self._console_lines += text.count("\n")
+        if self._console_lines > 500:
+            self.console.delete("1.0", f"{self._console_lines - 400 + 1}.0")
+            self._console_lines = 400
         
         self.console.see("end")
         self.console.configure(state="disabled")
     
+    def set_widget(self, widget, **options):
+        """Configure only the options that changed since the last call"""
+        state = self._widget_state.setdefault(widget, {})
+        changed = {k: v for k, v in options.items() if k not in state or state[k] != v}
+        if changed:
+            widget.configure(**changed)
+            state.update(changed)
+    
     def update_status(self, status):
         """Update the server status"""
         self.server_status = status
         
         if status == "running":
-            self.status_indicator.configure(text_color=COLORS["accent_green"])
-            self.status_label.configure(text="Online")
-            self.start_btn.configure(state="disabled")
-            self.stop_btn.configure(state="normal")
-            self.restart_btn.configure(state="normal")
+            self.set_widget(self.status_indicator, text_color=COLORS["accent_green"])
+            self.set_widget(self.status_label, text="Online")
+            self.set_widget(self.start_btn, state="disabled")
+            self.set_widget(self.stop_btn, state="normal")
+            self.set_widget(self.restart_btn, state="normal")
         elif status == "offline":
-            self.status_indicator.configure(text_color=COLORS["accent_red"])
-            self.status_label.configure(text="Offline")
-            self.start_btn.configure(state="normal")
-            self.stop_btn.configure(state="disabled")
-            self.restart_btn.configure(state="disabled")
-            self.player_count = 0
-            self.online_players = []
-            self.update_player_list()
-            self.player_count_label.configure(text=f"0/{self.max_players} online")
+            self.set_widget(self.status_indicator, text_color=COLORS["accent_red"])
+            self.set_widget(self.status_label, text="Offline")
+            self.set_widget(self.start_btn, state="normal")
+            self.set_widget(self.stop_btn, state="disabled")
+            self.set_widget(self.restart_btn, state="disabled")
+            self.update_players(clear=True)
         else:
-            self.status_indicator.configure(text_color=COLORS["accent_yellow"])
-            self.status_label.configure(text=status.capitalize())
-            self.start_btn.configure(state="disabled")
-            self.stop_btn.configure(state="disabled")
-            self.restart_btn.configure(state="disabled")
+            self.set_widget(self.status_indicator, text_color=COLORS["accent_yellow"])
+            self.set_widget(self.status_label, text=status.capitalize())
+            self.set_widget(self.start_btn, state="disabled")
+            self.set_widget(self.stop_btn, state="disabled")
+            self.set_widget(self.restart_btn, state="disabled")
     
     def start_server(self):
         """Start the Minecraft server"""
@@ -946,10 +1288,18 @@ class MinecraftServerManager(ctk.CTk):
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                bufsize=0,
                 creationflags=subprocess.CREATE_NO_WINDOW
             )
+            # Output is decoded by read_pipe_lines; only commands need a text wrapper,
+            # which sends each command as soon as its newline is written. The pipe is
+            # raw with bufsize=0, so a BufferedWriter retries partial writes
+            self._stdin = io.TextIOWrapper(
+                io.BufferedWriter(self.server_process.stdin),
+                encoding="utf-8",
+                write_through=True,
+                line_buffering=True
+            )
             
             thread = threading.Thread(target=self.read_output, daemon=True)
             thread.start()
@@ -967,8 +1317,7 @@ class MinecraftServerManager(ctk.CTk):
         self.log_message("[Manager] Stopping server...", "info")
         
         try:
-            self.server_process.stdin.write("stop\n")
-            self.server_process.stdin.flush()
+            self._stdin.write("stop\n")
         except:
             self.server_process.terminate()
     
@@ -987,8 +1336,7 @@ class MinecraftServerManager(ctk.CTk):
             return
         
         try:
-            self.server_process.stdin.write(cmd + "\n")
-            self.server_process.stdin.flush()
+            self._stdin.write(cmd + "\n")
             self.log_message(f"> {cmd}")
         except:
             pass
@@ -998,81 +1346,108 @@ class MinecraftServerManager(ctk.CTk):
     def read_output(self):
         """Read server output"""
         try:
-            for line in iter(self.server_process.stdout.readline, ''):
-                if line:
-                    self.output_queue.put(line.strip())
-                    
-                    if "Done" in line and "For help" in line:
-                        self.output_queue.put("__STATUS_RUNNING__")
+            for lines in read_pipe_lines(self.server_process.stdout):
+                batch = []
+                for line in lines:
+                    line = line.strip()
+                    batch.append(line)
                     
-                    # Detect player join/leave
-                    if " joined the game" in line:
-                        match = re.search(r'(\w+) joined the game', line)
-                        if match:
-                            self.output_queue.put(f"__PLAYER_JOIN__{match.group(1)}")
-                    elif " left the game" in line:
-                        match = re.search(r'(\w+) left the game', line)
+                    # Most lines are neither, so check cheap suffix/substring
+                    # gates before running any regex
+                    if line.endswith((" joined the game", " left the game")):
+                        # Detect player join/leave
+                        match = PLAYER_EVENT_RE.search(line)
                         if match:
-                            self.output_queue.put(f"__PLAYER_LEAVE__{match.group(1)}")
+                            if match.lastgroup == "join":
+                                batch.append(f"__PLAYER_JOIN__{match.group('join')}")
+                            else:
+                                batch.append(f"__PLAYER_LEAVE__{match.group('leave')}")
+                    elif "For help" in line and SERVER_DONE_RE.search(line):
+                        batch.append("__STATUS_RUNNING__")
+                self.queue_lines(batch)
             
-            self.output_queue.put("__STATUS_STOPPED__")
+            self.queue_output("__STATUS_STOPPED__")
         except:
             pass
     
     def process_output_queue(self):
-        """Process output queue"""
-        try:
-            while True:
-                line = self.output_queue.get_nowait()
+        """Drain the output queue on the UI thread"""
+        # Take everything queued so far in one go
+        with self._out_lock:
+            lines, self._out_deque = self._out_deque, deque()
+            self._drain_pending = False
+        
+        # Plain log lines are batched into one console insert
+        pending = []
+        for line in lines:
+            if not line.startswith("__"):
+                pending.append(line)
+                if len(pending) >= 500:
+                    self.write_console(pending)
+                    pending = []
+                continue
+            
+            # Flush first so console order matches server output
+            if pending:
+                self.write_console(pending)
+                pending = []
+            
+            if line == "__STATUS_RUNNING__":
+                self.update_status("running")
+                self.log_message("[Manager] Server is ONLINE!", "success")
+                self.add_activity("Server is now online", "info")
+                # Auto-start Playit tunnel when server comes online
+                if not self.playit_running:
+                    self.start_playit()
+            elif line == "__STATUS_STOPPED__":
+                self.server_process = None
+                self.update_status("offline")
+                self.log_message("[Manager] Server stopped", "info")
+                self.add_activity("Server stopped", "info")
+                # Auto-stop Playit tunnel when server stops
+                if self.playit_running:
+                    self.stop_playit()
                 
-                if line == "__STATUS_RUNNING__":
-                    self.update_status("running")
-                    self.log_message("[Manager] Server is ONLINE!", "success")
-                    self.add_activity("Server is now online", "info")
-                    # Auto-start Playit tunnel when server comes online
-                    if not self.playit_running:
-                        self.start_playit()
-                elif line == "__STATUS_STOPPED__":
-                    self.server_process = None
-                    self.update_status("offline")
-                    self.log_message("[Manager] Server stopped", "info")
-                    self.add_activity("Server stopped", "info")
-                    # Auto-stop Playit tunnel when server stops
-                    if self.playit_running:
-                        self.stop_playit()
-                    
-                    if getattr(self, '_restart_pending', False):
-                        self._restart_pending = False
-                        self.after(1000, self.start_server)
-                elif line.startswith("__PLAYER_JOIN__"):
-                    player = line.replace("__PLAYER_JOIN__", "")
-                    self.online_players.append(player)
-                    self.player_count = len(self.online_players)
-                    self.player_count_label.configure(text=f"{self.player_count}/{self.max_players} online")
-                    self.update_player_list()
-                    self.add_activity(f"{player} joined", "join")
-                elif line.startswith("__PLAYER_LEAVE__"):
-                    player = line.replace("__PLAYER_LEAVE__", "")
-                    if player in self.online_players:
-                        self.online_players.remove(player)
-                    self.player_count = len(self.online_players)
-                    self.player_count_label.configure(text=f"{self.player_count}/{self.max_players} online")
-                    self.update_player_list()
-                    self.add_activity(f"{player} left", "leave")
-                elif line.startswith("__PLAYIT_ADDRESS__"):
-                    addr = line.replace("__PLAYIT_ADDRESS__", "")
-                    self.playit_address = addr
-                    self.playit_address_label.configure(text=f"🔗 {addr}")
-                    self.log_message(f"[Playit] Tunnel: {addr}", "success")
-                elif line.startswith("[Playit]"):
-                    self.log_message(line)
-                else:
-                    self.log_message(line)
-        except queue.Empty:
-            pass
+                if getattr(self, '_restart_pending', False):
+                    self._restart_pending = False
+                    self.after(1000, self.start_server)
+            elif line.startswith("__PLAYER_JOIN__"):
+                player = line.replace("__PLAYER_JOIN__", "")
+                self.update_players(added=player)
+                self.add_activity(f"{player} joined", "join")
+            elif line.startswith("__PLAYER_LEAVE__"):
+                player = line.replace("__PLAYER_LEAVE__", "")
+                self.update_players(removed=player)
+                self.add_activity(f"{player} left", "leave")
+            elif line.startswith("__PLAYIT_ADDRESS__"):
+                addr = line.replace("__PLAYIT_ADDRESS__", "")
+                self.playit_address = addr
+                self.set_widget(self.playit_address_label, text=f"🔗 {addr}")
+                self.log_message(f"[Playit] Tunnel: {addr}", "success")
+            else:
+                self.log_message(line)
         
-        # Poll queue less frequently for better performance
-        self.after(100, self.process_output_queue)
+        if pending:
+            self.write_console(pending)
+    
+    def queue_output(self, line):
+        """Queue a line for the UI thread and wake it up"""
+        self.queue_lines([line])
+    
+    def queue_lines(self, lines):
+        """Queue a batch of lines for the UI thread, waking it only if it isn't already due"""
+        if not lines:
+            return
+        with self._out_lock:
+            self._out_deque.extend(lines)
+            if self._drain_pending:
+                return
+            self._drain_pending = True
+        try:
+            self.event_generate("<<ServerOutput>>", when="tail")
+        except Exception:
+            # Window is closing; nothing left to wake
+            pass
     
     def toggle_playit(self):
         """Toggle playit.gg tunnel"""
@@ -1095,13 +1470,13 @@ class MinecraftServerManager(ctk.CTk):
                 cwd=self.server_dir,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
+                bufsize=0,
                 creationflags=subprocess.CREATE_NO_WINDOW
             )
             
             self.playit_running = True
-            self.playit_indicator.configure(text_color=COLORS["accent_green"])
-            self.playit_status.configure(text="Online")
+            self.set_widget(self.playit_indicator, text_color=COLORS["accent_green"])
+            self.set_widget(self.playit_status, text="Online")
             self.add_activity("Tunnel started", "info")
             
             thread = threading.Thread(target=self.read_playit_output, daemon=True)
@@ -1116,35 +1491,31 @@ class MinecraftServerManager(ctk.CTk):
             self.playit_process = None
         
         self.playit_running = False
-        self.playit_indicator.configure(text_color=COLORS["accent_red"])
-        self.playit_status.configure(text="Offline")
+        self.set_widget(self.playit_indicator, text_color=COLORS["accent_red"])
+        self.set_widget(self.playit_status, text="Offline")
         self.playit_address = ""
-        self.playit_address_label.configure(text="")
+        self._playit_address_found = False
+        self.set_widget(self.playit_address_label, text="")
         self.log_message("[Playit] Tunnel stopped", "info")
         self.add_activity("Tunnel stopped", "info")
     
     def read_playit_output(self):
         """Read playit output and detect tunnel address"""
         try:
-            for line in iter(self.playit_process.stdout.readline, ''):
-                if line:
+            for lines in read_pipe_lines(self.playit_process.stdout):
+                batch = []
+                for line in lines:
                     line_stripped = line.strip()
-                    self.output_queue.put(f"[Playit] {line_stripped}")
+                    batch.append(f"[Playit] {line_stripped}")
                     
-                    # Detect tunnel address patterns
-                    # Common patterns: "tunnel address: xyz.playit.gg:12345" or URL patterns
-                    if ".playit.gg" in line_stripped or "playit.gg:" in line_stripped:
-                        # Try to extract address
-                        import re
-                        match = re.search(r'([a-zA-Z0-9-]+\.playit\.gg(?::\d+)?)', line_stripped)
+                    # Detect tunnel address, e.g. "tunnel address: xyz.playit.gg:12345";
+                    # it is only announced once, so stop scanning after the first hit
+                    if not self._playit_address_found:
+                        match = PLAYIT_ADDRESS_RE.search(line_stripped)
                         if match:
-                            self.output_queue.put(f"__PLAYIT_ADDRESS__{match.group(1)}")
-                    
-                    # Also check for "address" or "connect" keywords
-                    if "address" in line_stripped.lower() or "connect" in line_stripped.lower():
-                        match = re.search(r'(\S+\.playit\.gg(?::\d+)?)', line_stripped)
-                        if match:
-                            self.output_queue.put(f"__PLAYIT_ADDRESS__{match.group(1)}")
+                            batch.append(f"__PLAYIT_ADDRESS__{match.group(1)}")
+                            self._playit_address_found = True
+                self.queue_lines(batch)
         except:
             pass
     
@@ -1167,125 +1538,118 @@ class MinecraftServerManager(ctk.CTk):
         # Schedule next backup
         self.after(self.backup_interval, self.auto_backup)
     
+    def run_git(self, *args, capture=True):
+        """Run a git command in the server directory, capturing its output unless told not to"""
+        if not capture:
+            # Discard regular output but keep stderr to report failures
+            return subprocess.run(
+                ["git", *args],
+                cwd=self.server_dir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                creationflags=subprocess.CREATE_NO_WINDOW
+            )
+        return subprocess.run(
+            ["git", *args],
+            cwd=self.server_dir,
+            capture_output=True,
+            text=True,
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+    
+    def get_remote_branch(self):
+        """Return the branch backups are pushed to, looked up once"""
+        if self._remote_branch is None:
+            # origin/HEAD names the remote's default branch, e.g. "origin/main"
+            result = self.run_git("symbolic-ref", "--short", "refs/remotes/origin/HEAD")
+            if result.returncode == 0 and result.stdout.strip():
+                self._remote_branch = result.stdout.strip().split("/", 1)[-1]
+            else:
+                result = self.run_git("branch", "--show-current")
+                self._remote_branch = result.stdout.strip() or "main"
+        return self._remote_branch
+    
+    def run_git_checked(self, *args, capture=True):
+        """Run a git command and return its stripped output, raising if it fails"""
+        result = self.run_git(*args, capture=capture)
+        if result.returncode != 0:
+            raise RuntimeError(f"git {args[0]} failed: {result.stderr.strip()}")
+        return (result.stdout or "").strip()
+    
+    def get_push_lease(self, branch):
+        """Return the remote tip the next push may replace, looked up only when unknown"""
+        if self._remote_tip is None:
+            # Every successful push updates origin/<branch>, so no fetch is needed
+            tracking = self.run_git("rev-parse", "--verify", "-q", f"refs/remotes/origin/{branch}")
+            if tracking.returncode == 0:
+                self._remote_tip = tracking.stdout.strip()
+            else:
+                # No tracking ref yet; ask the remote once (empty if the branch is new)
+                remote = self.run_git_checked("ls-remote", "origin", f"refs/heads/{branch}")
+                self._remote_tip = remote.split()[0] if remote else ""
+        return self._remote_tip
+    
     def run_backup(self):
         """Run git backup to GitHub with rolling 2-commit history"""
         self.log_message("[Backup] Starting backup to GitHub...", "info")
         
         def do_backup():
             try:
-                # Git add all changes
-                subprocess.run(
-                    ["git", "add", "-A"],
-                    cwd=self.server_dir,
-                    capture_output=True,
-                    text=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
-                
-                # Git commit
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-                commit_result = subprocess.run(
-                    ["git", "commit", "-m", f"Backup: {timestamp}"],
-                    cwd=self.server_dir,
-                    capture_output=True,
-                    text=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
+                # Stage all changes and snapshot the index as a tree
+                self.run_git_checked("add", "-A", capture=False)
+                tree = self.run_git_checked("write-tree")
                 
                 # Check if there were changes to commit
-                if "nothing to commit" in commit_result.stdout:
+                head = self.run_git("rev-parse", "--verify", "-q", "HEAD^{tree}")
+                head_tree = head.stdout.strip() if head.returncode == 0 else None
+                if tree == head_tree:
                     self.after(0, lambda: self.log_backup("No changes to backup"))
-                    self.output_queue.put("[Backup] No changes to backup")
+                    self.queue_output("[Backup] No changes to backup")
                     return
                 
-                # Count commits
-                count_result = subprocess.run(
-                    ["git", "rev-list", "--count", "HEAD"],
-                    cwd=self.server_dir,
-                    capture_output=True,
-                    text=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
-                commit_count = int(count_result.stdout.strip()) if count_result.returncode == 0 else 0
-                
-                # If more than 2 commits, squash old ones
-                if commit_count > 2:
-                    self.after(0, lambda c=commit_count: self.log_backup(f"Cleaning old backups ({c} -> 2)"))
-                    self.output_queue.put(f"[Backup] Cleaning old backups ({commit_count} -> 2)")
-                    
-                    # Reset to squash, keeping files
-                    subprocess.run(
-                        ["git", "reset", "--soft", "HEAD~" + str(commit_count - 1)],
-                        cwd=self.server_dir,
-                        capture_output=True,
-                        text=True,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                    
-                    # Re-commit as single commit
-                    subprocess.run(
-                        ["git", "commit", "-m", f"Previous backup"],
-                        cwd=self.server_dir,
-                        capture_output=True,
-                        text=True,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                    
-                    # Add current changes again
-                    subprocess.run(
-                        ["git", "add", "-A"],
-                        cwd=self.server_dir,
-                        capture_output=True,
-                        text=True,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                    
-                    # New commit for current backup
-                    subprocess.run(
-                        ["git", "commit", "-m", f"Backup: {timestamp}"],
-                        cwd=self.server_dir,
-                        capture_output=True,
-                        text=True,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
+                # Rebuild a 2-commit history: last backup as the root, this one on top
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+                parent_args = []
+                if head_tree:
+                    previous = self.run_git_checked("commit-tree", head_tree, "-m", "Previous backup")
+                    parent_args = ["-p", previous]
+                commit = self.run_git_checked("commit-tree", tree, *parent_args, "-m", f"Backup: {timestamp}")
+                if not commit:
+                    raise RuntimeError("git commit-tree returned no commit")
+                self.run_git_checked("update-ref", "HEAD", commit, capture=False)
                 
-                # Force push to update remote
-                push_result = subprocess.run(
-                    ["git", "push", "origin", "main", "--force"],
-                    cwd=self.server_dir,
-                    capture_output=True,
-                    text=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
+                # Force push to update remote, but only over the commit the last backup
+                # left there, so commits pushed from elsewhere are never overwritten
+                branch = self.get_remote_branch()
+                lease = self.get_push_lease(branch)
+                push_result = self.run_git("push", f"--force-with-lease={branch}:{lease}", "origin", f"HEAD:{branch}")
                 
                 if push_result.returncode == 0:
+                    self._remote_tip = commit
                     self.after(0, lambda: self.log_backup("✓ Backup pushed to GitHub!"))
                     self.after(0, lambda: self.update_last_backup_label())
-                    self.output_queue.put("[Backup] ✓ Backup pushed to GitHub!")
+                    self.queue_output("[Backup] ✓ Backup pushed to GitHub!")
                     self.last_backup = datetime.now()
                 else:
-                    # Try 'master' branch
-                    push_result = subprocess.run(
-                        ["git", "push", "origin", "master", "--force"],
-                        cwd=self.server_dir,
-                        capture_output=True,
-                        text=True,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                    if push_result.returncode == 0:
-                        self.after(0, lambda: self.log_backup("✓ Backup pushed to GitHub!"))
-                        self.after(0, lambda: self.update_last_backup_label())
-                        self.output_queue.put("[Backup] ✓ Backup pushed to GitHub!")
-                        self.last_backup = datetime.now()
-                    else:
-                        self.after(0, lambda: self.log_backup(f"Push failed: {push_result.stderr}"))
-                        self.output_queue.put(f"[Backup] Push failed: {push_result.stderr}")
+                    error = push_result.stderr.strip()
+                    if "stale info" in error:
+                        error = f"{branch} on origin was changed outside the manager, not overwriting it\n{error}"
+                    self.after(0, lambda: self.log_backup(f"Push failed: {error}"))
+                    self.queue_output(f"[Backup] Push failed: {error}")
                         
             except Exception as e:
-                self.output_queue.put(f"[Backup] Error: {e}")
+                error = str(e)
+                self.after(0, lambda: self.log_backup(f"Backup failed: {error}"))
+                self.queue_output(f"[Backup] Error: {error}")
+        
+        def run_locked():
+            with self._backup_lock:
+                do_backup()
         
-        # Run backup in background thread
-        thread = threading.Thread(target=do_backup, daemon=True)
+        # Run backup in a daemon thread, one at a time, so a hung git push
+        # can't keep the process alive after the window closes
+        thread = threading.Thread(target=run_locked, daemon=True)
         thread.start()
     
     def on_closing(self):